@@ -0,0 +1,41 @@
+""" Helpers for running independent algorithm restarts in parallel.
+"""
+
+# License: BSD 3 clause
+
+import copy
+
+import numpy as np
+from joblib import Parallel, delayed
+
+
+def run_parallel_restarts(algorithm, problem, restarts, n_jobs,
+                          check_can_stop=False, **kwargs):
+    """Run restarts + 1 single-restart calls of algorithm with joblib and
+    return the result with the best fitness.
+
+    Each call gets its own seed drawn from np.random, so results are
+    reproducible when the caller has seeded np.random. n_jobs follows joblib
+    semantics. If check_can_stop is True, restarts after the first one whose
+    final state satisfies problem.can_stop() are discarded, matching the
+    serial restart loop's early exit. The problem and kwargs must be
+    picklable.
+    """
+    seeds = np.random.randint(1, np.iinfo(np.int32).max, size=restarts + 1)
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(algorithm)(**dict(kwargs, problem=problem, restarts=0, random_state=int(seed)))
+        for seed in seeds)
+
+    if check_can_stop:
+        # check on a copy so that problem itself is left unchanged
+        stop_problem = copy.copy(problem)
+        for count, result in enumerate(results, 1):
+            stop_problem.set_state(result[0])
+            if stop_problem.can_stop():
+                results = results[:count]
+                break
+
+    # results hold maximize * fitness; max() keeps the first of any ties,
+    # matching the serial restart loop
+    maximize = problem.get_maximize()
+    return max(results, key=lambda result: maximize * result[1])
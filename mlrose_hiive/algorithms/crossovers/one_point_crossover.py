@@ -15,5 +15,5 @@ class OnePointCrossOver(_CrossOverBase):
 
     def mate(self, p1, p2):
         n = 1 + np.random.randint(self._length-1)
-        child = np.array([*p1[:n], *p2[n:]])
+        child = np.concatenate((p1[:n], p2[n:]))
         return child
@@ -15,8 +15,7 @@ class UniformCrossOver(_CrossOverBase):
 
     def mate(self, p1, p2):
         n = np.random.randint(2, size=self._length)
-        x = np.vstack((p1, p2))
-        child = x[n, np.arange(self._length)]
+        child = np.where(n, p2, p1)
         return child
     """
     def mate(self, p1, p2):
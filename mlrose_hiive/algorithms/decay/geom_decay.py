@@ -1,6 +1,8 @@
 # Author: Genevieve Hayes (modified by Andrew Rollings)
 # License: BSD 3 clause
 
+import numpy as np
+
 
 class GeomDecay:
     """
@@ -75,6 +77,22 @@ class GeomDecay:
 
         return temp
 
+    def evaluate_vec(self, ts):
+        """Evaluate the temperature parameter at each time in ts.
+
+        Parameters
+        ----------
+        ts: array
+            Times at which the temperature parameter T is evaluated.
+
+        Returns
+        -------
+        temps: array
+            Temperature parameter at each time in ts.
+        """
+        temps = np.maximum(self.init_temp*np.power(self.decay, np.asarray(ts)), self.min_temp)
+        return temps
+
     def get_info__(self, t=None, prefix=''):
         prefix = f'_{prefix}__schedule_' if len(prefix) > 0 else 'schedule_'
         info = {
@@ -20,28 +20,29 @@ def _get_hamming_distance_float(population, p1):
     return hamming_distances
 
 
+def _sample_from_probs(probs, size=None):
+    # inverse-cdf sampling - same draws as np.random.choice(len(probs), size, p=probs)
+    # but without its per-call validation
+    cdf = np.cumsum(probs)
+    cdf /= cdf[-1]
+    return np.searchsorted(cdf, np.random.random(size), side='right')
+
+
 def _genetic_alg_select_parents(pop_size, problem,
                                 get_hamming_distance_func,
-                                hamming_factor=0.0):
+                                hamming_factor):
+    # hamming-weighted selection only - unweighted pairs are drawn in bulk by genetic_alg
     mating_probabilities = problem.get_mate_probs()
-    if get_hamming_distance_func is not None and hamming_factor > 0.01:
-        selected = np.random.choice(pop_size, p=mating_probabilities)
-        population = problem.get_population()
-        p1 = population[selected]
-        hamming_distances = get_hamming_distance_func(population, p1)
-        hfa = hamming_factor / (1.0 - hamming_factor)
-        hamming_distances = (hamming_distances * hfa) * mating_probabilities
-        hamming_distances /= hamming_distances.sum()
-        selected = np.random.choice(pop_size, p=hamming_distances)
-        p2 = population[selected]
-
-        return p1, p2
-
-    selected = np.random.choice(pop_size,
-                                size=2,
-                                p=mating_probabilities)
-    p1 = problem.get_population()[selected[0]]
-    p2 = problem.get_population()[selected[1]]
+    selected = _sample_from_probs(mating_probabilities)
+    population = problem.get_population()
+    p1 = population[selected]
+    hamming_distances = get_hamming_distance_func(population, p1)
+    hfa = hamming_factor / (1.0 - hamming_factor)
+    hamming_distances = (hamming_distances * hfa) * mating_probabilities
+    hamming_distances /= hamming_distances.sum()
+    selected = _sample_from_probs(hamming_distances)
+    p2 = population[selected]
+
     return p1, p2
 
 
@@ -91,6 +92,9 @@ def genetic_alg(problem, pop_size=200, pop_breed_percent=0.75, elite_dreg_ratio=
         If specified, this callback will be invoked once per iteration.
         Parameters are (iteration, max attempts reached?, current best state, current best fit, user callback data).
         Return true to continue iterating, or false to stop.
+        Population arrays are reused between generations, so an array
+        returned by :code:`problem.get_population()` is overwritten two
+        generations later; copy it to keep it.
     callback_user_info: any, default: None
         User data passed as last parameter of callback.
     Returns
@@ -164,6 +168,7 @@ def genetic_alg(problem, pop_size=200, pop_breed_percent=0.75, elite_dreg_ratio=
         else:
             get_hamming_distance_func = _get_hamming_distance_default
 
+    current_fitness = problem.get_fitness()
     attempts = 0
     iters = 0
 
@@ -175,6 +180,13 @@ def genetic_alg(problem, pop_size=200, pop_breed_percent=0.75, elite_dreg_ratio=
         over_population = dregs_size + elites_size - survivors_size
         breeding_pop_size -= over_population
 
+    # the next generation is written into one of two buffers, alternating
+    # each generation so the current population is never overwritten
+    # while it is being bred from
+    population = problem.get_population()
+    next_gen_buffers = [np.empty((pop_size, problem.get_length()), dtype=population.dtype)
+                        for _ in range(2)]
+
     continue_iterating = True
     while (attempts < max_attempts) and (iters < max_iters):
         iters += 1
@@ -184,39 +196,62 @@ def genetic_alg(problem, pop_size=200, pop_breed_percent=0.75, elite_dreg_ratio=
         problem.eval_mate_probs()
 
         # Create next generation of population
-        next_gen = []
-        for _ in range(breeding_pop_size):
-            # Select parents
-            parent_1, parent_2 = _genetic_alg_select_parents(pop_size=pop_size,
-                                                             problem=problem,
-                                                             hamming_factor=hamming_factor,
-                                                             get_hamming_distance_func=get_hamming_distance_func)
+        population = problem.get_population()
+        next_gen = next_gen_buffers[iters % 2]
+
+        # Select parents - all pairs are drawn in one call unless hamming
+        # weighting needs to see the first parent before choosing the second
+        if get_hamming_distance_func is not None and hamming_factor > 0.01:
+            parent_pairs = [_genetic_alg_select_parents(pop_size=pop_size,
+                                                        problem=problem,
+                                                        hamming_factor=hamming_factor,
+                                                        get_hamming_distance_func=get_hamming_distance_func)
+                            for _ in range(breeding_pop_size)]
+        else:
+            selected = _sample_from_probs(problem.get_mate_probs(),
+                                          size=(breeding_pop_size, 2))
+            parent_pairs = zip(population[selected[:, 0]], population[selected[:, 1]])
 
+        for i, (parent_1, parent_2) in enumerate(parent_pairs):
             # Create offspring
-            child = problem.reproduce(parent_1, parent_2, mutation_prob)
-            next_gen.append(child)
+            next_gen[i] = problem.reproduce(parent_1, parent_2, mutation_prob)
+        next_gen_size = breeding_pop_size
 
-        # fill remaining population with elites/dregs
+        # pick elites/dregs while the prior generation's fitness is current
+        survivors = None
         if survivors_size > 0:
-            last_gen = list(zip(problem.get_population(), problem.get_pop_fitness()))
-            sorted_parents = sorted(last_gen, key=lambda f: -f[1])
-            best_parents = sorted_parents[:elites_size]
-            next_gen.extend([p[0] for p in best_parents])
+            pop_fitness = problem.get_pop_fitness()
+            sorted_parents = np.argsort(-pop_fitness, kind='stable')
+            survivors = sorted_parents[:elites_size]
             if dregs_size > 0:
-                worst_parents = sorted_parents[-dregs_size:]
-                next_gen.extend([p[0] for p in worst_parents])
+                survivors = np.concatenate((survivors, sorted_parents[-dregs_size:]))
+            survivors = survivors[:pop_size - next_gen_size]
+            survivor_fitness = pop_fitness[survivors]
+
+        # evaluate the offspring only
+        problem.set_population(next_gen[:next_gen_size])
+
+        # fill remaining population with elites/dregs, reusing their known fitness
+        if survivors is not None and len(survivors) > 0:
+            next_gen[next_gen_size:next_gen_size + len(survivors)] = population[survivors]
+            pop_fitness = np.concatenate((problem.get_pop_fitness(), survivor_fitness))
+            next_gen_size += len(survivors)
+            problem.set_population(next_gen[:next_gen_size], pop_fitness)
 
-        next_gen = np.array(next_gen[:pop_size])
-        problem.set_population(next_gen)
+        next_gen = next_gen[:next_gen_size]
 
-        next_state = problem.best_child()
-        next_fitness = problem.eval_fitness(next_state)
+        # population fitness was evaluated by set_population - reuse it
+        pop_fitness = problem.get_pop_fitness()
+        best_child = np.argmax(pop_fitness)
+        next_state = next_gen[best_child]
+        next_fitness = pop_fitness[best_child]
 
         # If best child is an improvement,
         # move to that state and reset attempts counter
-        current_fitness = problem.get_fitness()
         if next_fitness > current_fitness:
-            problem.set_state(next_state)
+            # copy, as next_gen is reused two generations from now
+            problem.set_state(np.copy(next_state))
+            current_fitness = next_fitness
             attempts = 0
         else:
             attempts += 1
@@ -245,6 +280,6 @@ def genetic_alg(problem, pop_size=200, pop_breed_percent=0.75, elite_dreg_ratio=
         # break out if requested
         if not continue_iterating:
             break
-    best_fitness = problem.get_maximize()*problem.get_fitness()
+    best_fitness = problem.get_maximize()*current_fitness
     best_state = problem.get_state()
     return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
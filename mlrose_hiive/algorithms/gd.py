@@ -89,7 +89,8 @@ def gradient_descent(problem, max_attempts=10, max_iters=np.inf,
     attempts = 0
     iters = 0
 
-    best_fitness = problem.get_maximize()*problem.get_fitness()
+    maximize = problem.get_maximize()
+    best_fitness = maximize*problem.get_fitness()
     best_state = problem.get_state()
 
     continue_iterating = True
@@ -126,8 +127,8 @@ def gradient_descent(problem, max_attempts=10, max_iters=np.inf,
         if not continue_iterating:
             break
 
-        if next_fitness > problem.get_maximize()*best_fitness:
-            best_fitness = problem.get_maximize()*next_fitness
+        if next_fitness > maximize*best_fitness:
+            best_fitness = maximize*next_fitness
             best_state = next_state
 
         problem.set_state(next_state)
@@ -6,15 +6,37 @@
 
 import numpy as np
 
+from mlrose_hiive.algorithms._parallel_restarts import run_parallel_restarts
 from mlrose_hiive.decorators import short_name
 
+# maximum number of states whose fitness is remembered during a hill climb
+_FITNESS_CACHE_SIZE = 8192
+
+
+def _cached_eval(problem, fitness_cache, state):
+    key = np.asarray(state).tobytes()
+    fitness = fitness_cache.get(key)
+    if fitness is None:
+        fitness = problem.eval_fitness(state)
+        if len(fitness_cache) >= _FITNESS_CACHE_SIZE:
+            # evict the oldest entry
+            del fitness_cache[next(iter(fitness_cache))]
+        fitness_cache[key] = fitness
+    return fitness
+
 
 @short_name('hc')
 def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
                curve=False, random_state=None,
-               state_fitness_callback=None, callback_user_info=None):
+               state_fitness_callback=None, callback_user_info=None,
+               n_jobs=1):
     """Use standard hill climbing to find the optimum for a given
     optimization problem.
+
+    The fitness of each state visited or evaluated as a neighbor is
+    memoised for the run, so a state is evaluated at most once. Noisy or
+    stochastic fitness functions are therefore not re-sampled when a state
+    is seen again.
     Parameters
     ----------
     problem: optimization object
@@ -42,6 +64,13 @@ def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
         Return true to continue iterating, or false to stop.
     callback_user_info: any, default: None
         User data passed as last parameter of callback.
+    n_jobs: int, default: 1
+        Number of processes used to run restarts in parallel, following
+        joblib semantics: if -1, all processors are used, if -2, all but
+        one, and so on. Restarts always run serially when
+        :code:`state_fitness_callback` is given. When run in parallel, the
+        problem must be picklable, :code:`problem` itself is left unchanged
+        and the returned curve is that of the best restart.
     Returns
     -------
     best_state: array
@@ -67,16 +96,27 @@ def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
     if init_state is not None and len(init_state) != problem.get_length():
         raise Exception("""init_state must have same length as problem.""")
 
+    if not isinstance(n_jobs, (int, np.integer)) or n_jobs == 0:
+        raise Exception("""n_jobs must be a non-zero integer.""")
+
     # Set random seed
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
+    if n_jobs != 1 and restarts > 0 and state_fitness_callback is None:
+        return run_parallel_restarts(hill_climb, problem, restarts, n_jobs,
+                                     max_iters=max_iters, init_state=init_state,
+                                     curve=curve)
+
     best_fitness = -np.inf
     best_state = None
 
     fitness_curve = []
     best_fitness_curve = []
 
+    # fitness of visited states and neighbors, keyed on state bytes
+    fitness_cache = {}
+
     continue_iterating = True
     for current_restart in range(restarts + 1):
         # Initialize optimization problem
@@ -93,14 +133,21 @@ def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
                                    state=problem.get_state(),
                                    fitness=problem.get_adjusted_fitness(),
                                    user_data=callback_extra_data)
+
+        current_fitness = problem.get_fitness()
+        fitness_cache[np.asarray(problem.get_state()).tobytes()] = current_fitness
         iters = 0
         while iters < max_iters:
             iters += 1
 
-            # Find neighbors and determine best neighbor
+            # Find neighbors and determine best neighbor, skipping fitness
+            # evaluations for states that have already been seen
             problem.find_neighbors()
-            next_state = problem.best_neighbor()
-            next_fitness = problem.eval_fitness(next_state)
+            neighbors = problem.neighbors
+            neighbor_fitness = [_cached_eval(problem, fitness_cache, neighbor) for neighbor in neighbors]
+            best_neighbor = np.argmax(neighbor_fitness)
+            next_state = neighbors[best_neighbor]
+            next_fitness = neighbor_fitness[best_neighbor]
 
             if curve:
                 fitness_curve.append((problem.get_adjusted_fitness(), problem.fitness_evaluations))
@@ -120,15 +167,16 @@ def hill_climb(problem, max_iters=np.inf, restarts=0, init_state=None,
                     break
 
             # If best neighbor is an improvement, move to that state
-            current_fitness = problem.get_fitness()
             if next_fitness > current_fitness:
-                problem.set_state(next_state)
+                # copy, so the state does not keep the neighbor matrix alive
+                problem.set_state(np.copy(next_state))
+                current_fitness = next_fitness
             else:
                 break
 
         # Update best state and best fitness
-        if problem.get_fitness() > best_fitness:
-            best_fitness = problem.get_fitness()
+        if current_fitness > best_fitness:
+            best_fitness = current_fitness
             best_state = problem.get_state()
             if curve:
                 best_fitness_curve = [*fitness_curve]
@@ -4,6 +4,8 @@
 # Author: Genevieve Hayes (modified by Andrew Rollings)
 # License: BSD 3 clause
 
+import inspect
+
 import numpy as np
 
 from mlrose_hiive.decorators import short_name
@@ -40,6 +42,9 @@ def mimic(problem, pop_size=200, keep_pct=0.2, max_attempts=10,
         If specified, this callback will be invoked once per iteration.
         Parameters are (iteration, max attempts reached?, current best state, current best fit, user callback data).
         Return true to continue iterating, or false to stop.
+        Population arrays are reused between generations, so an array
+        returned by :code:`problem.get_population()` is overwritten two
+        generations later; copy it to keep it.
     callback_user_info: any, default: None
         User data passed as last parameter of callback.
     Returns
@@ -104,9 +109,17 @@ def mimic(problem, pop_size=200, keep_pct=0.2, max_attempts=10,
                                fitness=problem.get_adjusted_fitness(),
                                fitness_evaluations=problem.fitness_evaluations,
                                user_data=callback_user_info)
+
+    current_fitness = problem.get_fitness()
     attempts = 0
     iters = 0
 
+    # samples are drawn into two alternating buffers, so the population being
+    # replaced is reused instead of a new array being allocated each generation
+    sample_buffers = [None, None]
+    # only reuse sample buffers if sample_pop accepts them - overrides may not
+    reuse_samples = 'out' in inspect.signature(problem.sample_pop).parameters
+
     continue_iterating = True
     while (attempts < max_attempts) and (iters < max_iters):
         iters += 1
@@ -119,18 +132,26 @@ def mimic(problem, pop_size=200, keep_pct=0.2, max_attempts=10,
         problem.eval_node_probs()
 
         # Generate new sample
-        new_sample = problem.sample_pop(pop_size)
+        buffer_index = iters % 2
+        if reuse_samples and sample_buffers[buffer_index] is not None:
+            new_sample = problem.sample_pop(pop_size, out=sample_buffers[buffer_index])
+        else:
+            new_sample = problem.sample_pop(pop_size)
+        sample_buffers[buffer_index] = new_sample
         problem.set_population(new_sample)
 
-        next_state = problem.best_child()
-
-        next_fitness = problem.eval_fitness(next_state)
+        # population fitness was evaluated by set_population - reuse it
+        pop_fitness = problem.get_pop_fitness()
+        best_child = np.argmax(pop_fitness)
+        next_state = new_sample[best_child]
+        next_fitness = pop_fitness[best_child]
 
         # If best child is an improvement,
         # move to that state and reset attempts counter
-        current_fitness = problem.get_fitness()
         if next_fitness > current_fitness:
-            problem.set_state(next_state)
+            # copy, as new_sample is reused two generations from now
+            problem.set_state(np.copy(next_state))
+            current_fitness = next_fitness
             attempts = 0
         else:
             attempts += 1
@@ -153,7 +174,10 @@ def mimic(problem, pop_size=200, keep_pct=0.2, max_attempts=10,
         if not continue_iterating:
             break
 
-    best_fitness = problem.get_maximize()*problem.get_fitness()
-    best_state = problem.get_state().astype(int)
+    best_fitness = problem.get_maximize()*current_fitness
+    best_state = problem.get_state()
+    # samples are already integer - only convert states that are not
+    if best_state.dtype.kind != 'i':
+        best_state = best_state.astype(int)
 
     return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
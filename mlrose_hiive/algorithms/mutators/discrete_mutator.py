@@ -19,8 +19,7 @@ class DiscreteMutator(_MutatorBase):
         mutate = np.where(rand < mutation_probability)[0]
 
         if self._max_val == 2:
-            for i in mutate:
-                child[i] = np.abs(child[i] - 1)
+            child[mutate] = 1 - child[mutate]
 
         else:
             for i in mutate:
@@ -6,13 +6,15 @@
 
 import numpy as np
 
+from mlrose_hiive.algorithms._parallel_restarts import run_parallel_restarts
 from mlrose_hiive.decorators import short_name
 
 
 @short_name('rhc')
 def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
                       init_state=None, curve=False, random_state=None,
-                      state_fitness_callback=None, callback_user_info=None):
+                      state_fitness_callback=None, callback_user_info=None,
+                      n_jobs=1):
     """Use randomized hill climbing to find the optimum for a given
     optimization problem.
     Parameters
@@ -49,6 +51,13 @@ def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
         Return true to continue iterating, or false to stop.
     callback_user_info: any, default: None
         User data passed as last parameter of callback.
+    n_jobs: int, default: 1
+        Number of processes used to run restarts in parallel, following
+        joblib semantics: if -1, all processors are used, if -2, all but
+        one, and so on. Restarts always run serially when
+        :code:`state_fitness_callback` is given. When run in parallel, the
+        problem must be picklable, :code:`problem` itself is left unchanged
+        and the returned curve is that of the best restart.
     Returns
     -------
     best_state: array
@@ -78,16 +87,28 @@ def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
     if init_state is not None and len(init_state) != problem.get_length():
         raise Exception("""init_state must have same length as problem.""")
 
+    if not isinstance(n_jobs, (int, np.integer)) or n_jobs == 0:
+        raise Exception("""n_jobs must be a non-zero integer.""")
+
     # Set random seed
     if isinstance(random_state, int) and random_state > 0:
         np.random.seed(random_state)
 
+    if n_jobs != 1 and restarts > 0 and state_fitness_callback is None:
+        return run_parallel_restarts(random_hill_climb, problem, restarts, n_jobs,
+                                     check_can_stop=True, max_attempts=max_attempts,
+                                     max_iters=max_iters, init_state=init_state, curve=curve)
+
     best_fitness = -np.inf
     best_state = None
 
     best_fitness_curve = []
     all_curves = []
 
+    # bind the per-step calls once rather than resolving them every iteration
+    random_neighbor = problem.random_neighbor
+    eval_fitness = problem.eval_fitness
+
     continue_iterating = True
     # problem.reset()
     for current_restart in range(restarts + 1):
@@ -110,6 +131,7 @@ def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
                                    fitness_evaluations=problem.fitness_evaluations,
                                    user_data=callback_extra_data)
 
+        current_fitness = problem.get_fitness()
         attempts = 0
         iters = 0
         while (attempts < max_attempts) and (iters < max_iters):
@@ -117,14 +139,14 @@ def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
             problem.current_iteration += 1
 
             # Find random neighbor and evaluate fitness
-            next_state = problem.random_neighbor()
-            next_fitness = problem.eval_fitness(next_state)
+            next_state = random_neighbor()
+            next_fitness = eval_fitness(next_state)
 
             # If best neighbor is an improvement,
             # move to that state and reset attempts counter
-            current_fitness = problem.get_fitness()
             if next_fitness > current_fitness:
                 problem.set_state(next_state)
+                current_fitness = next_fitness
                 attempts = 0
             else:
                 attempts += 1
@@ -155,7 +177,6 @@ def random_hill_climb(problem, max_attempts=10, max_iters=np.inf, restarts=0,
                     break
 
         # Update best state and best fitness
-        current_fitness = problem.get_fitness()
         if current_fitness > best_fitness:
             best_fitness = current_fitness
             best_state = problem.get_state()
@@ -4,17 +4,42 @@
 # Author: Genevieve Hayes (modified by Andrew Rollings)
 # License: BSD 3 clause
 
+import math
+
 import numpy as np
 
 from mlrose_hiive.algorithms.decay import GeomDecay
 from mlrose_hiive.decorators import short_name
 
+# number of temperatures evaluated per evaluate_vec call - blocks start small
+# and double, so short runs do not compute temperatures they never reach
+_MIN_TEMP_BLOCK_SIZE = 64
+_MAX_TEMP_BLOCK_SIZE = 4096
+
+
+class _UniformBuffer:
+    # uniform [0, 1) draws from np.random, generated a block at a time to
+    # avoid a full np.random call per draw
+    def __init__(self, size=4096):
+        self._size = size
+        self._values = []
+        self._index = size
+
+    def next(self):
+        if self._index >= self._size:
+            self._values = np.random.random(self._size).tolist()
+            self._index = 0
+        value = self._values[self._index]
+        self._index += 1
+        return value
+
 
 @short_name('sa')
 def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
                         max_iters=np.inf, init_state=None, curve=False,
                         fevals=False, random_state=None,
-                        state_fitness_callback=None, callback_user_info=None):
+                        state_fitness_callback=None, callback_user_info=None,
+                        t_min=1e-12):
     """Use simulated annealing to find the optimum for a given
     optimization problem.
     Parameters
@@ -51,6 +76,8 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
         Return true to continue iterating, or false to stop.
     callback_user_info: any, default: None
         User data passed as last parameter of callback.
+    t_min: float, default: 1e-12
+        Temperature at or below which the algorithm stops.
     Returns
     -------
     best_state: array
@@ -97,32 +124,57 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
 
     fitness_curve = []
 
+    current_fitness = problem.get_fitness()
     attempts = 0
     iters = 0
     continue_iterating = True
 
+    # bind the per-step calls once rather than resolving them every iteration
+    random_neighbor = problem.random_neighbor
+    eval_fitness = problem.eval_fitness
+    uniform = _UniformBuffer().next
+
+    # schedules without a vectorised evaluate_vec are evaluated one step at a time
+    evaluate_vec = getattr(schedule, 'evaluate_vec', None)
+    temps = []
+    temp_index = 0
+    temp_block_size = _MIN_TEMP_BLOCK_SIZE
+
     while (attempts < max_attempts) and (iters < max_iters):
-        temp = schedule.evaluate(iters)
+        if evaluate_vec is None:
+            temp = schedule.evaluate(iters)
+        else:
+            # precompute the schedule a block at a time
+            if temp_index == len(temps):
+                temps_end = int(min(iters + temp_block_size, max_iters))
+                temps = np.asarray(evaluate_vec(np.arange(iters, temps_end))).tolist()
+                temp_index = 0
+                temp_block_size = min(2*temp_block_size, _MAX_TEMP_BLOCK_SIZE)
+            temp = temps[temp_index]
+            temp_index += 1
         iters += 1
         problem.current_iteration += 1
 
-        if temp == 0:
+        if temp <= t_min:
             break
 
         else:
             # Find random neighbor and evaluate fitness
-            next_state = problem.random_neighbor()
-            next_fitness = problem.eval_fitness(next_state)
+            next_state = random_neighbor()
+            next_fitness = eval_fitness(next_state)
 
-            # Calculate delta E and change prob
-            current_fitness = problem.get_fitness()
+            # Calculate delta E
             delta_e = next_fitness - current_fitness
-            prob = np.exp(delta_e/temp)
-            # print(f'{iters} : {current_fitness}')
+
             # If best neighbor is an improvement or random value is less
-            # than prob, move to that state and reset attempts counter
-            if (delta_e > 0) or (np.random.uniform() < prob):
+            # than exp(delta_e/temp), move to that state and reset attempts
+            # counter. The test is done in log space (u in (0, 1]) so no exp
+            # is evaluated and it cannot overflow. Once temp is negligible
+            # next to delta_e the move is rejected without drawing.
+            if (delta_e > 0) or (temp >= -delta_e*1e-10
+                                 and math.log(1.0 - uniform())*temp < delta_e):
                 problem.set_state(next_state)
+                current_fitness = next_fitness
                 attempts = 0
             else:
                 attempts += 1
@@ -146,10 +198,7 @@ def simulated_annealing(problem, schedule=GeomDecay(), max_attempts=10,
         if not continue_iterating:
             break
 
-    best_fitness = problem.get_maximize()*problem.get_fitness()
+    best_fitness = problem.get_maximize()*current_fitness
     best_state = problem.get_state()
 
-    if curve:
-        return best_state, best_fitness, np.asarray(fitness_curve)
-    else:
-        return best_state, best_fitness
+    return best_state, best_fitness, np.asarray(fitness_curve) if curve else None
@@ -201,7 +201,7 @@ class _OptProb:
         """
         return self.state
 
-    def set_population(self, new_population):
+    def set_population(self, new_population, pop_fitness=None):
         """ Change the current population to a specified new population and get
         the fitness of all members.
 
@@ -209,19 +209,19 @@ class _OptProb:
         ----------
         new_population: array
             Numpy array containing new population.
+        pop_fitness: array, default: None
+            Fitness of each member of new_population, if already known.
+            If :code:`None`, the fitness of all members is evaluated.
         """
         self.population = new_population
-        self.evaluate_population_fitness()
+        if pop_fitness is None:
+            self.evaluate_population_fitness()
+        else:
+            self.pop_fitness = pop_fitness
 
     def evaluate_population_fitness(self):
         # Calculate fitness
-        pop_fitness = []
-
-        for i in range(len(self.population)):
-            fitness = self.eval_fitness(self.population[i])
-            pop_fitness.append(fitness)
-
-        self.pop_fitness = np.array(pop_fitness)
+        self.pop_fitness = np.array([self.eval_fitness(state) for state in self.population])
 
     def set_state(self, new_state):
         """
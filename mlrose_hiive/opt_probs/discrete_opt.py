@@ -216,23 +216,29 @@ class DiscreteOpt(_OptProb):
     def find_neighbors(self):
         """Find all neighbors of the current state.
         """
-        self.neighbors = []
+        state = np.asarray(self.state)
 
         if self.max_val == 2:
-            for i in range(self.length):
-                neighbor = np.copy(self.state)
-                neighbor[i] = np.abs(neighbor[i] - 1)
-                self.neighbors.append(neighbor)
+            # Flip each element in turn
+            neighbors = np.repeat(state[np.newaxis, :], self.length, axis=0)
+            inds = np.arange(self.length)
+            neighbors[inds, inds] = np.abs(state - 1)
 
         else:
-            for i in range(self.length):
-                vals = list(np.arange(self.max_val))
-                vals.remove(self.state[i])
+            # Every other value of each element, in element then value order
+            vals = np.broadcast_to(np.arange(self.max_val), (self.length, self.max_val))
+            other_vals = vals[vals != state[:, np.newaxis]]
+            n_changes = self.max_val - 1
 
-                for j in vals:
-                    neighbor = np.copy(self.state)
-                    neighbor[i] = j
-                    self.neighbors.append(neighbor)
+            if len(other_vals) != self.length * n_changes:
+                raise Exception("""state values must be integers in the range"""
+                                + """ [0, max_val).""")
+
+            # Build all neighbors in one array, one changed element per row
+            neighbors = np.repeat(state[np.newaxis, :], self.length * n_changes, axis=0)
+            neighbors[np.arange(len(neighbors)), np.repeat(np.arange(self.length), n_changes)] = other_vals
+
+        self.neighbors = neighbors
 
     def find_sample_order(self):
         """Determine order in which to generate sample vector elements.
@@ -269,14 +275,13 @@ class DiscreteOpt(_OptProb):
         if (keep_pct < 0) or (keep_pct > 1):
             raise Exception("""keep_pct must be between 0 and 1.""")
 
-        # Determine threshold
+        # Determine threshold - np.percentile selects by partitioning, so
+        # this is linear in the population size
         theta = np.percentile(self.pop_fitness, 100 * (1 - keep_pct))
 
-        # Determine samples for keeping
-        keep_inds = np.where(self.pop_fitness >= theta)[0]
-
-        # Determine sample for keeping
-        self.keep_sample = self.population[keep_inds]
+        # Determine sample for keeping - every sample at or above the
+        # threshold is kept, including ties
+        self.keep_sample = self.population[self.pop_fitness >= theta]
 
     def get_keep_sample(self):
         """ Return the keep sample.
@@ -326,9 +331,9 @@ class DiscreteOpt(_OptProb):
             neighbor[i] = np.abs(neighbor[i] - 1)
 
         else:
-            vals = list(np.arange(self.max_val))
-            vals.remove(neighbor[i])
-            neighbor[i] = vals[np.random.randint(0, self.max_val - 1)]
+            # pick uniformly from the other max_val - 1 values without
+            # building a candidate list on every call
+            neighbor[i] = (neighbor[i] + 1 + np.random.randint(0, self.max_val - 1)) % self.max_val
 
         return neighbor
 
@@ -401,13 +406,16 @@ class DiscreteOpt(_OptProb):
         self.fitness_evaluations = 0
         self.current_iteration = 0
 
-    def sample_pop(self, sample_size):
+    def sample_pop(self, sample_size, out=None):
         """Generate new sample from probability density.
 
         Parameters
         ----------
         sample_size: int
             Size of sample to be generated.
+        out: array, default: None
+            Array of shape (sample_size, length) to write the sample into.
+            If :code:`None`, a new array is allocated.
 
         Returns
         -------
@@ -422,8 +430,9 @@ class DiscreteOpt(_OptProb):
             else:
                 raise Exception("""sample_size must be a positive integer.""")
 
-        # Initialize new sample matrix
-        new_sample = np.zeros([sample_size, self.length])
+        # Initialize new sample matrix - every element is overwritten below.
+        # Samples are integer state vectors, not floats
+        new_sample = np.zeros([sample_size, self.length], dtype=int) if out is None else out
 
         # Get value of first element in new samples
         new_sample[:, 0] = np.random.choice(self.max_val, sample_size,
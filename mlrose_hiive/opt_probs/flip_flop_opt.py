@@ -35,8 +35,9 @@ class FlipFlopOpt(DiscreteOpt):
         self.set_state(state)
 
     def evaluate_population_fitness(self):
-        # Calculate fitness
-        pop_fitness = self.fitness_fn.evaluate_many(self.population)
+        # Calculate fitness - signed and counted as eval_fitness does
+        pop_fitness = self.maximize*self.fitness_fn.evaluate_many(self.population)
+        self.fitness_evaluations += len(self.population)
         self.pop_fitness = pop_fitness
 
     def random_pop(self, pop_size):
@@ -66,9 +67,7 @@ class FlipFlopOpt(DiscreteOpt):
         self.population = np.array(population)
         """
         population = np.random.rand(pop_size, self.length)
-        population[population < 0.5] = 0
-        population[population >= 0.5] = 1
-        self.population = population
+        self.population = (population >= 0.5).astype(int)
         # np.round(population, out=population).astype(int)
 
         self.evaluate_population_fitness()
@@ -168,13 +168,16 @@ class TSPOpt(DiscreteOpt):
 
         return neighbor
 
-    def sample_pop(self, sample_size):
+    def sample_pop(self, sample_size, out=None):
         """Generate new sample from probability density.
 
         Parameters
         ----------
         sample_size: int
             Size of sample to be generated.
+        out: array, default: None
+            Array of shape (sample_size, length) to write the sample into.
+            If :code:`None`, a new array is allocated.
 
         Returns
         -------
@@ -190,6 +193,12 @@ class TSPOpt(DiscreteOpt):
                 raise Exception("""sample_size must be a positive integer.""")
 
         self.find_sample_order()
+
+        if out is not None:
+            for i in range(sample_size):
+                out[i] = self.random_mimic()
+            return out
+
         new_sample = []
 
         for _ in range(sample_size):
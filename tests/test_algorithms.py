@@ -10,9 +10,24 @@ except:
     sys.path.append("..")
 import unittest
 import numpy as np
-from mlrose_hiive import (OneMax, DiscreteOpt, ContinuousOpt, hill_climb,
-                          random_hill_climb, simulated_annealing, genetic_alg,
-                          mimic)
+from mlrose_hiive import (OneMax, FlipFlop, FourPeaks, DiscreteOpt, ContinuousOpt,
+                          FlipFlopOpt, hill_climb, random_hill_climb,
+                          simulated_annealing, genetic_alg, mimic, GeomDecay,
+                          CustomSchedule)
+
+
+class _StopAnywhereOpt(DiscreteOpt):
+    """DiscreteOpt that can stop at any state."""
+
+    def can_stop(self):
+        return True
+
+
+class _NoOutSampleOpt(DiscreteOpt):
+    """DiscreteOpt overriding sample_pop without an out parameter."""
+
+    def sample_pop(self, sample_size):
+        return DiscreteOpt.sample_pop(self, sample_size)
 
 
 class TestAlgorithms(unittest.TestCase):
@@ -40,6 +55,28 @@ class TestAlgorithms(unittest.TestCase):
 
         assert (np.array_equal(best_state, x) and best_fitness == 0)
 
+    @staticmethod
+    def test_mimic_flip_flop_min():
+        """Test mimic function for a minimization problem with vectorized
+        population fitness"""
+
+        problem = FlipFlopOpt(length=20, maximize=False)
+        best_state, best_fitness, _ = mimic(problem, random_state=3)
+
+        assert best_fitness == FlipFlop().evaluate(best_state)
+
+    @staticmethod
+    def test_mimic_sample_pop_override():
+        """Test mimic function with a sample_pop override that does not
+        accept an output array"""
+
+        problem = _NoOutSampleOpt(5, OneMax(), maximize=True)
+        best_state, best_fitness, _ = mimic(problem, max_attempts=50)
+
+        x = np.array([1, 1, 1, 1, 1])
+
+        assert (np.array_equal(best_state, x) and best_fitness == 5)
+
     @staticmethod
     def test_hill_climb_discrete_max():
         """Test hill_climb function for a discrete maximization problem"""
@@ -51,6 +88,56 @@ class TestAlgorithms(unittest.TestCase):
 
         assert (np.array_equal(best_state, x) and best_fitness == 5)
 
+    @staticmethod
+    def test_hill_climb_parallel_restarts():
+        """Test hill_climb function with restarts run in parallel is
+        reproducible"""
+
+        problem = DiscreteOpt(20, FourPeaks(t_pct=0.15), maximize=True)
+        best_state, best_fitness, curve = hill_climb(
+            problem, restarts=6, random_state=1, curve=True, n_jobs=2)
+        same_state, same_fitness, same_curve = hill_climb(
+            problem, restarts=6, random_state=1, curve=True, n_jobs=2)
+
+        assert (np.array_equal(best_state, same_state)
+                and best_fitness == same_fitness
+                and np.array_equal(curve, same_curve))
+
+    @staticmethod
+    def test_hill_climb_n_jobs_zero():
+        """Test hill_climb function rejects n_jobs of zero"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True)
+
+        try:
+            hill_climb(problem, restarts=4, n_jobs=0)
+        except Exception as e:
+            assert str(e) == 'n_jobs must be a non-zero integer.'
+        else:
+            assert False
+
+    @staticmethod
+    def test_hill_climb_cached_evaluations():
+        """Test hill_climb does not re-evaluate states it has already seen"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True)
+        x = np.array([0, 0, 0, 0, 0])
+        best_state, best_fitness, _ = hill_climb(problem, init_state=x)
+
+        # 6 set_state calls + 5 + 4 + 3 + 3 + 3 + 3 unseen neighbors
+        assert (np.array_equal(best_state, np.ones(5)) and best_fitness == 5
+                and problem.fitness_evaluations == 27)
+
+    @staticmethod
+    def test_hill_climb_list_init_state():
+        """Test hill_climb function with init_state given as a list"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True)
+        best_state, best_fitness, _ = hill_climb(problem,
+                                                 init_state=[0, 0, 0, 0, 0])
+
+        assert (np.array_equal(best_state, np.ones(5)) and best_fitness == 5)
+
     @staticmethod
     def test_hill_climb_continuous_max():
         """Test hill_climb function for a continuous maximization problem"""
@@ -109,6 +196,39 @@ class TestAlgorithms(unittest.TestCase):
 
         assert (np.array_equal(best_state, x) and best_fitness == 5)
 
+    @staticmethod
+    def test_random_hill_climb_parallel_restarts():
+        """Test random_hill_climb function with restarts run in parallel"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=False)
+        best_state, best_fitness, curve = random_hill_climb(
+            problem, max_attempts=10, restarts=4, curve=True, n_jobs=2)
+
+        x = np.array([0, 0, 0, 0, 0])
+
+        assert (np.array_equal(best_state, x) and best_fitness == 0
+                and len(curve) > 0)
+
+    @staticmethod
+    def test_random_hill_climb_parallel_can_stop():
+        """Test random_hill_climb function with restarts run in parallel
+        stops after the first restart that can stop"""
+
+        problem = _StopAnywhereOpt(20, FourPeaks(t_pct=0.15), maximize=True)
+        best_state, best_fitness, curve = random_hill_climb(
+            problem, max_attempts=10, restarts=6, random_state=1, curve=True,
+            n_jobs=2)
+
+        # only the first restart is kept, run with the first seed drawn
+        np.random.seed(1)
+        seed = int(np.random.randint(1, np.iinfo(np.int32).max))
+        first_state, first_fitness, first_curve = random_hill_climb(
+            problem, max_attempts=10, random_state=seed, curve=True)
+
+        assert (np.array_equal(best_state, first_state)
+                and best_fitness == first_fitness
+                and np.array_equal(curve, first_curve))
+
     @staticmethod
     def test_random_hill_climb_continuous_max():
         """Test random_hill_climb function for a continuous maximization
@@ -227,6 +347,38 @@ class TestAlgorithms(unittest.TestCase):
 
         assert best_fitness == 1
 
+    @staticmethod
+    def test_simulated_annealing_t_min():
+        """Test simulated_annealing function stops once temperature falls
+        to t_min"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True)
+        x = np.array([0, 0, 0, 0, 0])
+
+        best_state, best_fitness, curve = simulated_annealing(
+            problem, schedule=GeomDecay(init_temp=1e-3, min_temp=0),
+            max_attempts=10, init_state=x, curve=True, t_min=1e-3)
+
+        assert (np.array_equal(best_state, x) and best_fitness == 0
+                and len(curve) == 0)
+
+    @staticmethod
+    def test_simulated_annealing_custom_schedule_calls():
+        """Test simulated_annealing only evaluates a custom schedule for the
+        steps that are run"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True)
+        times = []
+
+        def custom(t):
+            times.append(t)
+            return 1.0
+
+        simulated_annealing(problem, schedule=CustomSchedule(custom),
+                            max_attempts=100, max_iters=5)
+
+        assert times == [0, 1, 2, 3, 4]
+
     @staticmethod
     def test_genetic_alg_discrete_max():
         """Test genetic_alg function for a discrete maximization problem"""
@@ -271,6 +423,42 @@ class TestAlgorithms(unittest.TestCase):
 
         assert (np.allclose(best_state, x, atol=0.5) and best_fitness < 1)
 
+    @staticmethod
+    def test_genetic_alg_flip_flop_min():
+        """Test genetic_alg function for a minimization problem with
+        vectorized population fitness"""
+
+        problem = FlipFlopOpt(length=20, maximize=False)
+        best_state, best_fitness, _ = genetic_alg(problem, random_state=3)
+
+        assert best_fitness == FlipFlop().evaluate(best_state)
+
+    @staticmethod
+    def test_genetic_alg_population_shape():
+        """Test genetic_alg keeps population shape and dtype with survivors
+        and hamming-weighted selection"""
+
+        for hamming_factor in [0.0, 0.5]:
+            problem = DiscreteOpt(5, OneMax(), maximize=True)
+            problem.random_pop(20)
+            pop_dtype = problem.get_population().dtype
+            populations = []
+
+            def callback(iteration, state, fitness, user_data, attempt=None,
+                         done=None, fitness_evaluations=None, curve=None):
+                populations.append(problem.get_population())
+                return True
+
+            genetic_alg(problem, pop_size=20, minimum_elites=2,
+                        minimum_dregs=2, hamming_factor=hamming_factor,
+                        max_attempts=5, max_iters=10, random_state=1,
+                        state_fitness_callback=callback)
+
+            assert len(populations) > 1
+            for population in populations:
+                assert population.shape == (20, 5)
+                assert population.dtype == pop_dtype
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,7 @@ except:
     import sys
     sys.path.append("..")
 import unittest
+import numpy as np
 from mlrose_hiive import GeomDecay, ArithDecay, ExpDecay, CustomSchedule
 
 
@@ -89,6 +90,36 @@ class TestDecay(unittest.TestCase):
 
         assert x == 15
 
+    @staticmethod
+    def test_geom_vec():
+        """Test geometric decay vectorized evaluation matches evaluate"""
+
+        schedule = GeomDecay(init_temp=10, decay=0.95, min_temp=1)
+        ts = np.arange(100)
+
+        assert np.allclose(schedule.evaluate_vec(ts),
+                           [schedule.evaluate(t) for t in ts])
+
+    @staticmethod
+    def test_arith_vec():
+        """Test arithmetic decay vectorized evaluation matches evaluate"""
+
+        schedule = ArithDecay(init_temp=10, decay=0.95, min_temp=1)
+        ts = np.arange(100)
+
+        assert np.allclose(schedule.evaluate_vec(ts),
+                           [schedule.evaluate(t) for t in ts])
+
+    @staticmethod
+    def test_exp_vec():
+        """Test exponential decay vectorized evaluation matches evaluate"""
+
+        schedule = ExpDecay(init_temp=10, exp_const=0.05, min_temp=1)
+        ts = np.arange(100)
+
+        assert np.allclose(schedule.evaluate_vec(ts),
+                           [schedule.evaluate(t) for t in ts])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -92,6 +92,25 @@ class TestOptProb(unittest.TestCase):
         assert (np.array_equal(problem.get_population(), pop)
                 and np.array_equal(problem.get_pop_fitness(), pop_fit))
 
+    @staticmethod
+    def test_set_population_known_fitness():
+        """Test set_population method does not re-evaluate a supplied
+        population fitness"""
+
+        problem = OptProb(5, OneMax(), maximize=True)
+
+        pop = np.array([[0, 0, 0, 0, 1],
+                        [1, 0, 1, 0, 1],
+                        [1, 1, 1, 1, 0]])
+
+        pop_fit = np.array([1, 3, 4])
+
+        problem.set_population(pop, pop_fit)
+
+        assert (np.array_equal(problem.get_population(), pop)
+                and np.array_equal(problem.get_pop_fitness(), pop_fit)
+                and problem.fitness_evaluations == 0)
+
     @staticmethod
     def test_best_child_max():
         """Test best_child method for a maximization problem"""
@@ -303,6 +322,31 @@ class TestDiscreteOpt(unittest.TestCase):
 
         assert np.array_equal(np.array(problem.neighbors), neigh)
 
+    @staticmethod
+    def test_find_neighbors_list_state():
+        """Test find_neighbors method when the state is set from a list"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True, max_val=3)
+        problem.set_state([0, 1, 2, 1, 0])
+        problem.find_neighbors()
+
+        assert np.shape(problem.neighbors) == (10, 5)
+
+    @staticmethod
+    def test_find_neighbors_max2_out_of_range():
+        """Test find_neighbors method when max_val is equal to 2 and the state
+        holds values other than 0 and 1"""
+
+        problem = DiscreteOpt(3, OneMax(), maximize=True, max_val=2)
+        problem.set_state(np.array([0, 2, 1]))
+        problem.find_neighbors()
+
+        neigh = np.array([[1, 2, 1],
+                          [0, 1, 1],
+                          [0, 2, 0]])
+
+        assert np.array_equal(np.array(problem.neighbors), neigh)
+
     @staticmethod
     def test_find_neighbors_max_gt2():
         """Test find_neighbors method when max_val is greater than 2"""
@@ -425,6 +469,24 @@ class TestDiscreteOpt(unittest.TestCase):
 
         assert (len(neigh) == 5 and sum_diff == 1)
 
+    @staticmethod
+    def test_random_neighbor_max_gt2_value():
+        """Test random_neighbor method changes one element to a different
+        value within range when max_val is greater than 2"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True, max_val=5)
+
+        x = np.array([0, 1, 2, 3, 4])
+        problem.set_state(x)
+
+        for _ in range(100):
+            neigh = problem.random_neighbor()
+            changed = np.where(neigh != x)[0]
+
+            assert len(changed) == 1
+            assert 0 <= neigh[changed[0]] < 5
+            assert neigh[changed[0]] != x[changed[0]]
+
     @staticmethod
     def test_random_pop():
         """Test random_pop method"""
@@ -499,7 +561,29 @@ class TestDiscreteOpt(unittest.TestCase):
         sample = problem.sample_pop(100)
 
         assert (np.shape(sample)[0] == 100 and np.shape(sample)[1] == 5
-                and np.sum(sample) > 0 and np.sum(sample) < 500)
+                and np.sum(sample) > 0 and np.sum(sample) < 500
+                and sample.dtype.kind == 'i')
+
+    @staticmethod
+    def test_sample_pop_out():
+        """Test sample_pop method writes into a supplied array"""
+
+        problem = DiscreteOpt(5, OneMax(), maximize=True)
+
+        pop = np.array([[0, 0, 0, 0, 1],
+                        [1, 0, 1, 0, 1],
+                        [1, 1, 1, 1, 0],
+                        [1, 0, 0, 0, 1],
+                        [0, 0, 0, 0, 0],
+                        [1, 1, 1, 1, 1]])
+
+        problem.keep_sample = pop
+        problem.eval_node_probs()
+
+        out = np.full([100, 5], -1.0)
+        sample = problem.sample_pop(100, out=out)
+
+        assert (sample is out and np.all((sample == 0) | (sample == 1)))
 
 
 class TestContinuousOpt(unittest.TestCase):